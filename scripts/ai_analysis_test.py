@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for ai_analysis.py."""
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import ai_analysis
+from ai_analysis import (
+    _ANALYSIS_CACHE_TTL,
+    _DIFF_UNAVAILABLE,
+    ClaudeAPIError,
+    _compute_git_diff,
+    _diff_with_git_cli,
+    _diff_with_pygit2,
+    _get_analysis,
+    pygit2,
+)
+
+
+def _git(*args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True, capture_output=True,
+    )
+
+
+class _GitRepoTestCase(unittest.TestCase):
+    """Runs each test inside a fresh two-commit repository.
+
+    ``HEAD~1`` holds ``a.rs`` and ``notes.txt``; ``HEAD`` modifies ``a.rs``
+    and adds ``b.rs`` and ``notes.md``.
+    """
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp.name)
+        _git("init", "-q")
+        Path("a.rs").write_text("fn a() {}\n")
+        Path("notes.txt").write_text("one\n")
+        _git("add", "-A")
+        _git("commit", "-q", "-m", "first")
+        Path("a.rs").write_text("fn a() {}\nfn a2() {}\n")
+        Path("b.rs").write_text("fn b() {}\n")
+        Path("notes.md").write_text("two\n")
+        _git("add", "-A")
+        _git("commit", "-q", "-m", "second")
+
+    def _enter_shallow_clone(self) -> None:
+        """Switch to a depth-1 clone, where ``HEAD~1`` does not exist."""
+        _git("clone", "-q", "--depth", "1", f"file://{os.getcwd()}", "shallow")
+        os.chdir("shallow")
+
+
+@unittest.skipIf(pygit2 is None, "pygit2 is not installed")
+class TestDiffWithPygit2(_GitRepoTestCase):
+    """Tests for the pygit2 diff path."""
+
+    def test_diffs_commits_not_working_tree(self) -> None:
+        """Test that added files are included and uncommitted edits are not."""
+        Path("a.rs").write_text("uncommitted\n")
+
+        stat, patch = _diff_with_pygit2()
+
+        self.assertIn("diff --git a/b.rs b/b.rs\nnew file mode", patch)
+        self.assertIn("+fn a2() {}", patch)
+        self.assertNotIn("uncommitted", patch)
+        self.assertNotIn("notes.md", patch)
+
+    def test_stat_matches_git_diff_stat(self) -> None:
+        """Test that the stat block is the one ``git diff --stat`` prints."""
+        expected = subprocess.run(
+            ["git", "diff", "--stat", "HEAD~1", "HEAD", "--", "*.rs"],
+            check=True, capture_output=True, text=True,
+        ).stdout
+
+        stat, _patch = _diff_with_pygit2()
+
+        self.assertEqual(stat, expected.strip())
+
+
+class TestDiffWithGitCli(_GitRepoTestCase):
+    """Tests for the git CLI diff path."""
+
+    def test_diffs_commits_not_working_tree(self) -> None:
+        """Test that uncommitted edits don't leak into the diff."""
+        Path("a.rs").write_text("uncommitted\n")
+
+        _stat, patch = _diff_with_git_cli()
+
+        self.assertIn("+fn a2() {}", patch)
+        self.assertNotIn("uncommitted", patch)
+
+    def test_splits_stat_from_patch(self) -> None:
+        """Test that the single invocation is split at the first file header."""
+        stat, patch = _diff_with_git_cli()
+
+        self.assertEqual(
+            stat.splitlines(),
+            [
+                "a.rs | 1 +",
+                " b.rs | 1 +",
+                " 2 files changed, 2 insertions(+)",
+            ],
+        )
+        self.assertTrue(patch.startswith("diff --git a/a.rs b/a.rs\n"))
+        self.assertNotIn(" files changed", patch)
+
+    def test_shallow_clone_returns_none(self) -> None:
+        """Test that git's nonzero exit without HEAD~1 is reported as None."""
+        self._enter_shallow_clone()
+        self.assertIsNone(_diff_with_git_cli())
+
+
+class TestComputeGitDiff(_GitRepoTestCase):
+    """Tests for _compute_git_diff's fallbacks."""
+
+    def test_shallow_clone_without_pygit2_is_unavailable(self) -> None:
+        """Test that a failed CLI diff falls through to the placeholder."""
+        self._enter_shallow_clone()
+        with patch.object(ai_analysis, "pygit2", None):
+            self.assertEqual(_compute_git_diff(), _DIFF_UNAVAILABLE)
+
+    @unittest.skipIf(pygit2 is None, "pygit2 is not installed")
+    def test_shallow_clone_with_pygit2_is_unavailable(self) -> None:
+        """Test that pygit2 failing to resolve HEAD~1 also falls through."""
+        self._enter_shallow_clone()
+        self.assertEqual(_compute_git_diff(), _DIFF_UNAVAILABLE)
+
+
+class TestGetAnalysis(unittest.TestCase):
+    """Tests for _get_analysis's response cache."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = Path(tmp.name)
+        self.api = Mock(return_value="**Verdict**: Likely noise")
+        patcher = patch.object(ai_analysis, "_call_claude_api", self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _analyze(self, prompt: str = "prompt") -> str:
+        return _get_analysis("key", "model", prompt, self.cache_dir)
+
+    def test_identical_prompt_hits_cache(self) -> None:
+        """Test that a repeated prompt is answered without calling the API."""
+        self.assertEqual(self._analyze(), "**Verdict**: Likely noise")
+        self.assertEqual(self._analyze(), "**Verdict**: Likely noise")
+        self.assertEqual(self.api.call_count, 1)
+
+        self._analyze("other prompt")
+        self.assertEqual(self.api.call_count, 2)
+
+    def test_expired_entry_calls_api_again(self) -> None:
+        """Test that an answer older than the TTL is not reused."""
+        self._analyze()
+        old = time.time() - _ANALYSIS_CACHE_TTL - 60
+        for entry in self.cache_dir.iterdir():
+            os.utime(entry, (old, old))
+
+        self._analyze()
+
+        self.assertEqual(self.api.call_count, 2)
+
+    def test_failed_call_is_not_cached(self) -> None:
+        """Test that an API error propagates and leaves the cache empty."""
+        self.api.side_effect = ClaudeAPIError("HTTP 529: overloaded")
+
+        with self.assertRaises(ClaudeAPIError):
+            self._analyze()
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+        self.api.side_effect = None
+        self.assertEqual(self._analyze(), "**Verdict**: Likely noise")
+        self.assertEqual(self.api.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,31 +9,70 @@ for Z-score-based regression detection.
 """
 from __future__ import annotations
 
-import json
+import itertools
+import math
 import os
 import re
 import statistics
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from json_io import dump_json, load_json
+
 _METRICS = ("latency", "throughput", "memory")
 
+# Historical results are stored as ``YYYYMMDDTHHMMSS.json``.
+_RESULT_NAME_RE = re.compile(r"^\d{8}T\d{6}\.json$")
+
+_MAX_LOAD_WORKERS = 8
+
 
 def load_historical_results(results_dir: Path, window: int) -> list[dict]:
     """Load the most recent *window* historical results."""
-    pattern = re.compile(r"^\d{8}T\d{6}\.json$")
-    result_files = sorted(
-        [f for f in results_dir.iterdir() if f.is_file() and pattern.match(f.name)],
-        key=lambda f: f.name,
-        reverse=True,
-    )
+    with os.scandir(results_dir) as it:
+        entries = [
+            e for e in it if _RESULT_NAME_RE.match(e.name) and e.is_file()
+        ]
+    entries.sort(key=lambda e: e.name, reverse=True)
+
+    paths = [e.path for e in entries[:window]]
+    if not paths:
+        return []
+
+    # The most recent result may become the baseline verbatim; older ones
+    # only feed the averages, so drop everything the baseline never reads.
+    project = itertools.chain([False], itertools.repeat(True))
 
-    results = []
-    for f in result_files[:window]:
-        with open(f) as fp:
-            results.append(json.load(fp))
+    # Reads release the GIL, so threads overlap the per-file I/O waits;
+    # map() keeps the newest-first order.
+    with ThreadPoolExecutor(max_workers=min(len(paths), _MAX_LOAD_WORKERS)) as ex:
+        return list(ex.map(_load_result, paths, project))
 
-    return results
+
+def _load_result(path: str, project: bool) -> dict:
+    """Load one historical result, projected unless it is the newest."""
+    result = load_json(path)
+    return _project_result(result) if project else result
+
+
+def _project_result(result: dict) -> dict:
+    """Keep only the benchmark fields used by ``calculate_average_baseline``."""
+    benchmarks: dict[str, dict] = {}
+    for name, bench in result.get("benchmarks", {}).items():
+        projected: dict = {}
+        for metric in _METRICS:
+            entry = bench.get(metric)
+            if entry:
+                projected[metric] = {
+                    "value": entry.get("value"),
+                    "unit": entry.get("unit", ""),
+                }
+        for field in ("test_vectors", "metadata"):
+            if field in bench:
+                projected[field] = bench[field]
+        benchmarks[name] = projected
+    return {"benchmarks": benchmarks}
 
 
 def _filter_outliers_iqr(values: list[float]) -> list[float]:
@@ -59,8 +98,20 @@ def _compute_metric_baseline(
     if not filtered:
         filtered = values
 
-    mean = statistics.mean(filtered)
-    stdev = statistics.stdev(filtered) if len(filtered) >= 3 else 0.0
+    # fmean/fsum work on floats directly; statistics.mean/stdev convert every
+    # sample to an exact Fraction, which dominates on long windows.
+    n = len(filtered)
+    mean = statistics.fmean(filtered)
+    # Like statistics.mean, keep an exact integer mean as an int so
+    # baseline.json keeps writing e.g. "value": 10 rather than 10.0.
+    if all(isinstance(v, int) for v in filtered):
+        total = sum(filtered)
+        if total % n == 0:
+            mean = total // n
+    if n >= 3:
+        stdev = math.sqrt(math.fsum((v - mean) ** 2 for v in filtered) / (n - 1))
+    else:
+        stdev = 0.0
     return {
         "value": round(mean, 2),
         "stdev": round(stdev, 2),
@@ -78,15 +129,18 @@ def calculate_average_baseline(results: list[dict]) -> dict:
 
     for result in results:
         for name, bench in result.get("benchmarks", {}).items():
-            if name not in benchmark_data:
-                benchmark_data[name] = {
-                    m: [] for m in _METRICS
-                } | {"sample": bench}
+            data = benchmark_data.get(name)
+            if data is None:
+                data = benchmark_data[name] = {m: [] for m in _METRICS}
+                data["sample"] = bench
 
             for metric in _METRICS:
-                val = bench.get(metric, {}).get("value")
+                entry = bench.get(metric)
+                if not entry:
+                    continue
+                val = entry.get("value")
                 if val is not None:
-                    benchmark_data[name][metric].append(val)
+                    data[metric].append(val)
 
     baseline: dict = {"benchmarks": {}}
 
@@ -136,17 +190,14 @@ def main() -> int:
         if results:
             # Fall back to using the most recent result as baseline
             baseline_path = results_dir / "baseline.json"
-            with open(baseline_path, "w") as f:
-                json.dump(results[0], f, indent=2)
+            dump_json(results[0], baseline_path)
             print("Using most recent result as baseline")
         return 0
 
     baseline = calculate_average_baseline(results)
     baseline_path = results_dir / "baseline.json"
 
-    with open(baseline_path, "w") as f:
-        json.dump(baseline, f, indent=2)
-        f.write("\n")
+    dump_json(baseline, baseline_path)
 
     print(f"Rolling baseline calculated from {len(results)} results")
     for name in baseline.get("benchmarks", {}):
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for calculate_rolling_baseline.py."""
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from calculate_rolling_baseline import (
+    calculate_average_baseline,
+    load_historical_results,
+)
+
+
+def _result(latency: float, extra: dict | None = None) -> dict:
+    bench = {
+        "latency": {"value": latency, "unit": "ns", "samples": [latency] * 3},
+        "test_vectors": {"verified": True},
+        "metadata": {"field": "koalabear"},
+    }
+    bench.update(extra or {})
+    return {"metadata": {"platform": {"os": "linux"}}, "benchmarks": {"fft": bench}}
+
+
+class TestLoadHistoricalResults(unittest.TestCase):
+    """Tests for load_historical_results."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.results_dir = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, name: str, data: dict) -> None:
+        (self.results_dir / name).write_text(json.dumps(data))
+
+    def test_loads_most_recent_window_newest_first(self) -> None:
+        """Test that only timestamped files are loaded, newest first."""
+        for day, latency in ((1, 100.0), (2, 200.0), (3, 300.0)):
+            self._write(f"2026010{day}T000000.json", _result(latency))
+        self._write("baseline.json", _result(999.0))
+        (self.results_dir / "20260104T000000.json").mkdir()
+
+        results = load_historical_results(self.results_dir, 2)
+
+        values = [r["benchmarks"]["fft"]["latency"]["value"] for r in results]
+        self.assertEqual(values, [300.0, 200.0])
+
+    def test_older_results_are_projected(self) -> None:
+        """Test that unused fields are dropped from all but the newest result."""
+        self._write("20260101T000000.json", _result(100.0))
+        self._write("20260102T000000.json", _result(200.0))
+
+        newest, older = load_historical_results(self.results_dir, 2)
+
+        self.assertIn("samples", newest["benchmarks"]["fft"]["latency"])
+        self.assertIn("metadata", newest)
+        self.assertEqual(
+            older,
+            {
+                "benchmarks": {
+                    "fft": {
+                        "latency": {"value": 100.0, "unit": "ns"},
+                        "test_vectors": {"verified": True},
+                        "metadata": {"field": "koalabear"},
+                    },
+                },
+            },
+        )
+
+
+class TestCalculateAverageBaseline(unittest.TestCase):
+    """Tests for calculate_average_baseline."""
+
+    def test_empty_results(self) -> None:
+        """Test that no results produce an empty baseline."""
+        self.assertEqual(calculate_average_baseline([]), {})
+
+    def test_mean_stdev_and_sample_fields(self) -> None:
+        """Test per-metric mean/stdev and copied sample fields."""
+        results = [_result(v) for v in (100.0, 102.0, 104.0)]
+
+        baseline = calculate_average_baseline(results)
+
+        bench = baseline["benchmarks"]["fft"]
+        self.assertEqual(
+            bench["latency"],
+            {"value": 102.0, "stdev": 2.0, "sample_count": 3, "unit": "ns"},
+        )
+        self.assertEqual(bench["test_vectors"], {"verified": True})
+        self.assertEqual(bench["metadata"], {"field": "koalabear"})
+        self.assertEqual(baseline["metadata"]["baseline_type"], "rolling_average")
+        self.assertEqual(baseline["metadata"]["sample_count"], 3)
+
+    def test_integer_samples_keep_integer_mean(self) -> None:
+        """Test that an exact mean of int samples stays an int, as before."""
+        results = [_result(v) for v in (10, 10, 10)]
+
+        latency = calculate_average_baseline(results)["benchmarks"]["fft"]["latency"]
+
+        self.assertIs(type(latency["value"]), int)
+        self.assertEqual(latency["value"], 10)
+
+        results = [_result(v) for v in (10, 11)]
+        latency = calculate_average_baseline(results)["benchmarks"]["fft"]["latency"]
+        self.assertEqual(latency["value"], 10.5)
+
+    def test_outliers_are_filtered(self) -> None:
+        """Test that IQR filtering drops an extreme sample."""
+        results = [_result(v) for v in (100.0, 101.0, 99.0, 100.0, 1000.0)]
+
+        bench = calculate_average_baseline(results)["benchmarks"]["fft"]
+
+        self.assertEqual(bench["latency"]["value"], 100.0)
+        self.assertEqual(bench["latency"]["sample_count"], 4)
+
+    def test_missing_metric_is_skipped(self) -> None:
+        """Test that metrics absent from every result are not emitted."""
+        bench = calculate_average_baseline([_result(100.0)])["benchmarks"]["fft"]
+
+        self.assertNotIn("throughput", bench)
+        self.assertEqual(bench["latency"]["stdev"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,15 @@
 """Check system load before running benchmarks."""
 from __future__ import annotations
 
-import json
 import os
+import re
 import sys
-from pathlib import Path
+
+from github_output import write_outputs
+from json_io import dump_json
+
+# MemTotal and MemAvailable are the first and third lines of /proc/meminfo.
+_MEMINFO_RE = re.compile(rb"MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)", re.S)
 
 
 def get_cpu_info() -> tuple[float, int]:
@@ -19,16 +24,17 @@ def get_cpu_info() -> tuple[float, int]:
 
 def get_memory_info() -> tuple[float, int, int]:
     """Return (usage ratio, used MB, total MB) from /proc/meminfo."""
-    meminfo: dict[str, int] = {}
-    with open("/proc/meminfo") as f:
-        for line in f:
-            parts = line.split()
-            if len(parts) >= 2:
-                key = parts[0].rstrip(":")
-                meminfo[key] = int(parts[1])
-
-    total_kb = meminfo.get("MemTotal", 0)
-    available_kb = meminfo.get("MemAvailable", 0)
+    fd = os.open("/proc/meminfo", os.O_RDONLY)
+    try:
+        buf = os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
+    match = _MEMINFO_RE.search(buf)
+    if match is None:
+        return 0.0, 0, 0
+    total_kb = int(match[1])
+    available_kb = int(match[2])
 
     if total_kb == 0:
         return 0.0, 0, 0
@@ -68,7 +74,7 @@ def main() -> int:
         },
     }
 
-    Path(output_file).write_text(json.dumps(result, indent=2) + "\n")
+    dump_json(result, output_file)
 
     if result["cpu"]["warning"]:
         print(
@@ -85,13 +91,12 @@ def main() -> int:
     print(f"CPU load: {normalized_load:.1%} ({load_avg:.2f} / {cpu_count} cores)")
     print(f"Memory: {mem_usage:.1%} ({mem_used_mb} / {mem_total_mb} MB)")
 
-    github_output = os.environ.get("GITHUB_OUTPUT")
-    if github_output:
-        with open(github_output, "a") as f:
-            f.write(f"cpu_load={normalized_load:.3f}\n")
-            f.write(f"memory_usage={mem_usage:.3f}\n")
-            f.write(f"cpu_warning={'true' if result['cpu']['warning'] else 'false'}\n")
-            f.write(f"memory_warning={'true' if result['memory']['warning'] else 'false'}\n")
+    write_outputs(
+        cpu_load=f"{normalized_load:.3f}",
+        memory_usage=f"{mem_usage:.3f}",
+        cpu_warning="true" if result["cpu"]["warning"] else "false",
+        memory_warning="true" if result["memory"]["warning"] else "false",
+    )
 
     return 0
 
@@ -20,17 +20,19 @@ Outputs:
 """
 from __future__ import annotations
 
-import json
 import os
 import sys
 from pathlib import Path
 
-# (key, direction, min_pct_floor)
-# direction = "increase" means an increase is a regression.
+from github_output import write_outputs
+from json_io import dump_json, load_json_cached
+
+# (key, regression_sign, min_pct_floor)
+# regression_sign = +1 means an increase is a regression, -1 a decrease.
 _METRICS = [
-    ("latency", "increase", 5.0),
-    ("throughput", "decrease", 5.0),
-    ("memory", "increase", 10.0),
+    ("latency", 1, 5.0),
+    ("throughput", -1, 5.0),
+    ("memory", 1, 10.0),
 ]
 
 
@@ -38,24 +40,29 @@ def _check_metric(
     curr_bench: dict,
     base_bench: dict,
     key: str,
-    direction: str,
+    regression_sign: int,
     min_pct_floor: float,
     zscore_threshold: float,
     pct_fallback: float,
-) -> dict | None:
+) -> tuple[dict, str, str] | None:
     """Check a single metric for regression or improvement.
 
-    Returns a detail dict or ``None`` if there is no significant change.
+    Returns ``(detail, annotation, label)`` or ``None`` if there is no
+    significant change.
     """
-    curr_val = curr_bench.get(key, {}).get("value", 0)
-    base_entry = base_bench.get(key, {})
-    base_val = base_entry.get("value", 0)
-    base_stdev = base_entry.get("stdev", 0)
-    sample_count = base_entry.get("sample_count", 0)
+    curr_entry = curr_bench.get(key)
+    base_entry = base_bench.get(key)
+    if not curr_entry or not base_entry:
+        return None
 
+    curr_val = curr_entry.get("value", 0)
+    base_val = base_entry.get("value", 0)
     if base_val <= 0 or curr_val <= 0:
         return None
 
+    base_stdev = base_entry.get("stdev", 0)
+    sample_count = base_entry.get("sample_count", 0)
+
     change_pct = (curr_val - base_val) / base_val * 100
     abs_change_pct = abs(change_pct)
 
@@ -71,11 +78,7 @@ def _check_metric(
     if not is_significant:
         return None
 
-    # Classify direction
-    if direction == "increase":
-        is_regression = change_pct > 0
-    else:  # "decrease" — a decrease is a regression
-        is_regression = change_pct < 0
+    is_regression = change_pct * regression_sign > 0
 
     result_dir = "regression" if is_regression else "improvement"
 
@@ -96,40 +99,37 @@ def _check_metric(
 
     return detail, emoji, label
 
-    return detail
-
-
-def main() -> int:
-    zscore_threshold = float(os.environ.get("ZSCORE_THRESHOLD", "3.0"))
-    pct_fallback = float(os.environ.get("REGRESSION_THRESHOLD", "0.10"))
-    baseline_path = Path(os.environ.get("BASELINE_PATH", "benchmark_data/baseline.json"))
-    results_file = os.environ.get("RESULTS_FILE", "benchmark_results.json")
-    details_file = os.environ.get("REGRESSION_DETAILS_FILE", "regression_details.json")
-
-    with open(results_file) as f:
-        current = json.load(f)
-
-    if not baseline_path.exists():
-        print("No baseline found, skipping regression detection")
-        return 0
 
-    with open(baseline_path) as f:
-        baseline = json.load(f)
+def detect_significant_changes(
+    current: dict,
+    baseline: dict,
+    zscore_threshold: float,
+    pct_fallback: float,
+) -> tuple[dict, bool, bool]:
+    """Compare every benchmark present in both *current* and *baseline*.
 
+    Prints a workflow annotation per significant change and returns
+    ``(details, has_regression, has_improvement)`` where *details* has the
+    ``regression_details.json`` layout.
+    """
     has_any_regression = False
     has_any_improvement = False
     all_details: dict = {"benchmarks": {}}
 
+    base_benches = baseline.get("benchmarks", {})
+
+    # Walk the current results in file order (keeps annotations and details
+    # ordered like the results) with one baseline lookup per benchmark.
     for name, curr_bench in current.get("benchmarks", {}).items():
-        if name not in baseline.get("benchmarks", {}):
+        base_bench = base_benches.get(name)
+        if base_bench is None:
             continue
 
-        base_bench = baseline["benchmarks"][name]
         bench_details: dict = {}
 
-        for key, direction, min_pct_floor in _METRICS:
+        for key, regression_sign, min_pct_floor in _METRICS:
             result = _check_metric(
-                curr_bench, base_bench, key, direction,
+                curr_bench, base_bench, key, regression_sign,
                 min_pct_floor, zscore_threshold, pct_fallback,
             )
             if result is None:
@@ -150,6 +150,28 @@ def main() -> int:
         if bench_details:
             all_details["benchmarks"][name] = bench_details
 
+    return all_details, has_any_regression, has_any_improvement
+
+
+def main() -> int:
+    zscore_threshold = float(os.environ.get("ZSCORE_THRESHOLD", "3.0"))
+    pct_fallback = float(os.environ.get("REGRESSION_THRESHOLD", "0.10"))
+    baseline_path = Path(os.environ.get("BASELINE_PATH", "benchmark_data/baseline.json"))
+    results_file = os.environ.get("RESULTS_FILE", "benchmark_results.json")
+    details_file = os.environ.get("REGRESSION_DETAILS_FILE", "regression_details.json")
+
+    current = load_json_cached(results_file)
+
+    if not baseline_path.exists():
+        print("No baseline found, skipping regression detection")
+        return 0
+
+    baseline = load_json_cached(baseline_path)
+
+    all_details, has_any_regression, has_any_improvement = detect_significant_changes(
+        current, baseline, zscore_threshold, pct_fallback,
+    )
+
     has_significant_change = has_any_regression or has_any_improvement
 
     if has_any_regression and has_any_improvement:
@@ -162,17 +184,12 @@ def main() -> int:
         change_type = ""
 
     # Write structured details for downstream consumers (Slack, AI analysis)
-    with open(details_file, "w") as f:
-        json.dump(all_details, f, indent=2)
-        f.write("\n")
-
-    github_output = os.environ.get("GITHUB_OUTPUT")
-    if github_output:
-        with open(github_output, "a") as f:
-            if has_significant_change:
-                f.write("has_significant_change=true\n")
-            if change_type:
-                f.write(f"change_type={change_type}\n")
+    dump_json(all_details, details_file)
+
+    write_outputs(
+        has_significant_change="true" if has_significant_change else None,
+        change_type=change_type or None,
+    )
 
     return 0
 
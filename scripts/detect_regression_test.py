@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for detect_regression.py."""
+from __future__ import annotations
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from detect_regression import detect_significant_changes
+
+
+def _bench(latency: float, stdev: float = 0.0, sample_count: int = 0) -> dict:
+    return {
+        "latency": {
+            "value": latency,
+            "stdev": stdev,
+            "sample_count": sample_count,
+            "unit": "ns",
+        },
+    }
+
+
+class TestDetectSignificantChanges(unittest.TestCase):
+    """Tests for detect_significant_changes."""
+
+    def _detect(self, current: dict, baseline: dict) -> tuple[dict, bool, bool]:
+        with redirect_stdout(io.StringIO()):
+            return detect_significant_changes(current, baseline, 3.0, 0.10)
+
+    def test_zscore_regression(self) -> None:
+        """Test that a large latency increase with stdev is a regression."""
+        current = {"benchmarks": {"fft": _bench(120.0)}}
+        baseline = {"benchmarks": {"fft": _bench(100.0, stdev=2.0, sample_count=5)}}
+
+        details, has_regression, has_improvement = self._detect(current, baseline)
+
+        self.assertTrue(has_regression)
+        self.assertFalse(has_improvement)
+        detail = details["benchmarks"]["fft"]["latency"]
+        self.assertEqual(detail["direction"], "regression")
+        self.assertEqual(detail["detection_method"], "zscore")
+        self.assertEqual(detail["zscore"], 10.0)
+        self.assertEqual(detail["change_pct"], 20.0)
+
+    def test_percentage_fallback_improvement(self) -> None:
+        """Test that without stdev the percentage threshold is used."""
+        current = {"benchmarks": {"fft": _bench(80.0)}}
+        baseline = {"benchmarks": {"fft": _bench(100.0)}}
+
+        details, has_regression, has_improvement = self._detect(current, baseline)
+
+        self.assertFalse(has_regression)
+        self.assertTrue(has_improvement)
+        detail = details["benchmarks"]["fft"]["latency"]
+        self.assertEqual(detail["detection_method"], "percentage")
+
+    def test_small_change_is_ignored(self) -> None:
+        """Test that changes below the threshold are not reported."""
+        current = {"benchmarks": {"fft": _bench(103.0)}}
+        baseline = {"benchmarks": {"fft": _bench(100.0, stdev=0.5, sample_count=5)}}
+
+        details, has_regression, has_improvement = self._detect(current, baseline)
+
+        self.assertEqual(details, {"benchmarks": {}})
+        self.assertFalse(has_regression)
+        self.assertFalse(has_improvement)
+
+    def test_benchmark_missing_from_baseline_is_skipped(self) -> None:
+        """Test that benchmarks without a baseline entry are skipped."""
+        current = {"benchmarks": {"new": _bench(500.0)}}
+        baseline = {"benchmarks": {"fft": _bench(100.0)}}
+
+        details, has_regression, has_improvement = self._detect(current, baseline)
+
+        self.assertEqual(details, {"benchmarks": {}})
+        self.assertFalse(has_regression or has_improvement)
+
+
+if __name__ == "__main__":
+    unittest.main()
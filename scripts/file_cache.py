@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Small on-disk text cache shared by the benchmark scripts.
+
+Entries are plain files named ``<key><suffix>`` inside a cache directory.
+Writes are atomic (temp file + ``os.replace``) and the directory is trimmed
+to the most recently used entries, so it can live next to historical results
+and be persisted across jobs.  The cache is best-effort: I/O errors are
+swallowed and treated as a miss.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+DEFAULT_MAX_ENTRIES = 32
+
+
+def read_entry(
+    cache_dir: Path,
+    key: str,
+    suffix: str = ".txt",
+    max_age: float | None = None,
+) -> str | None:
+    """Return the cached text for *key*, or ``None`` on a miss.
+
+    Entries written more than *max_age* seconds ago are treated as a miss.
+    Without *max_age*, a hit bumps the entry's mtime so the LRU sweep keeps
+    it; with it, the mtime is left alone because it is the entry's write
+    time, and bumping it would keep a regularly-read entry alive forever.
+    """
+    path = cache_dir / f"{key}{suffix}"
+    try:
+        if max_age is not None:
+            if time.time() - path.stat().st_mtime > max_age:
+                return None
+            return path.read_text()
+        text = path.read_text()
+        os.utime(path)
+    except OSError:
+        return None
+    return text
+
+
+def write_entry(
+    cache_dir: Path,
+    key: str,
+    text: str,
+    suffix: str = ".txt",
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> None:
+    """Atomically store *text* under *key*, then evict the oldest entries."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False,
+        ) as f:
+            f.write(text)
+        os.replace(f.name, cache_dir / f"{key}{suffix}")
+        _evict(cache_dir, suffix, max_entries)
+    except OSError:
+        pass
+
+
+def _evict(cache_dir: Path, suffix: str, max_entries: int) -> None:
+    """Remove all but the *max_entries* most recently used entries."""
+    entries = [p for p in cache_dir.iterdir() if p.name.endswith(suffix)]
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    for p in entries[max_entries:]:
+        p.unlink(missing_ok=True)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for file_cache.py."""
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from file_cache import read_entry, write_entry
+
+
+class TestFileCache(unittest.TestCase):
+    """Tests for the file_cache module."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name) / "cache"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_miss_returns_none(self) -> None:
+        """Test that a missing entry (and missing directory) is a miss."""
+        self.assertIsNone(read_entry(self.cache_dir, "absent"))
+
+    def test_round_trip(self) -> None:
+        """Test that a written entry is read back."""
+        write_entry(self.cache_dir, "key", "hello")
+        self.assertEqual(read_entry(self.cache_dir, "key"), "hello")
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Test that entries older than max_age are ignored."""
+        write_entry(self.cache_dir, "key", "hello")
+        old = time.time() - 3600
+        os.utime(self.cache_dir / "key.txt", (old, old))
+        self.assertIsNone(read_entry(self.cache_dir, "key", max_age=60))
+        self.assertEqual(read_entry(self.cache_dir, "key"), "hello")
+
+    def test_hit_does_not_extend_max_age(self) -> None:
+        """Test that a hit just before expiry doesn't restart the TTL."""
+        write_entry(self.cache_dir, "key", "hello")
+        path = self.cache_dir / "key.txt"
+        written = time.time() - 59
+        os.utime(path, (written, written))
+
+        self.assertEqual(read_entry(self.cache_dir, "key", max_age=60), "hello")
+
+        self.assertEqual(path.stat().st_mtime, written)
+        later = written - 2  # as if two more seconds had passed
+        os.utime(path, (later, later))
+        self.assertIsNone(read_entry(self.cache_dir, "key", max_age=60))
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that only max_entries most recent entries are kept."""
+        for i in range(3):
+            write_entry(self.cache_dir, f"k{i}", str(i), max_entries=3)
+            stamp = time.time() - 100 + i
+            os.utime(self.cache_dir / f"k{i}.txt", (stamp, stamp))
+
+        write_entry(self.cache_dir, "k3", "3", max_entries=3)
+
+        self.assertIsNone(read_entry(self.cache_dir, "k0"))
+        for i in range(1, 4):
+            self.assertEqual(read_entry(self.cache_dir, f"k{i}"), str(i))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Write step outputs to ``$GITHUB_OUTPUT``."""
+from __future__ import annotations
+
+import os
+
+
+def write_outputs(**outputs: str | None) -> None:
+    """Append ``key=value`` lines for *outputs* to ``$GITHUB_OUTPUT``.
+
+    All lines go out in a single ``write(2)``.  Outputs whose value is
+    ``None`` are skipped, and nothing happens outside GitHub Actions.
+    """
+    github_output = os.environ.get("GITHUB_OUTPUT")
+    if not github_output:
+        return
+
+    payload = "".join(
+        f"{key}={value}\n" for key, value in outputs.items() if value is not None
+    )
+    if not payload:
+        return
+
+    # A raw O_APPEND descriptor skips the buffered text-file wrapper; the
+    # payload is only a few hundred bytes.
+    fd = os.open(github_output, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, payload.encode())
+    finally:
+        os.close(fd)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Keep-alive HTTPS connection pool built on ``http.client``.
+
+``urllib.request.urlopen`` opens a fresh TCP + TLS connection for every
+request.  :class:`HTTPSPool` keeps idle connections to a single host around
+so repeated API calls from one script reuse the same TLS session.  Uses only
+the stdlib so no pip dependencies are needed in CI.
+"""
+from __future__ import annotations
+
+import atexit
+import http.client
+import queue
+from typing import Any, NamedTuple
+
+from json_io import loads
+
+# Errors raised when the server has silently closed an idle connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# Only these are re-sent after a stale-connection error: the server may have
+# processed the first attempt, and e.g. a repeated POST could be billed twice.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class Response(NamedTuple):
+    """A fully-read HTTP response."""
+
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+
+    def json(self) -> Any:
+        return loads(self.body)
+
+
+class HTTPSPool:
+    """Reusable HTTPS connections to one host, safe to share across threads.
+
+    Args:
+        host: server host name, e.g. ``"api.github.com"``.
+        headers: default headers sent with every request.
+        timeout: socket timeout in seconds.
+        maxsize: maximum number of idle connections kept open.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float = 60.0,
+        maxsize: int = 4,
+    ) -> None:
+        self.host = host
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self._idle: queue.LifoQueue[http.client.HTTPSConnection] = queue.LifoQueue(
+            maxsize
+        )
+        atexit.register(self.close)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """Send a request and return the fully-read response.
+
+        Non-2xx statuses are returned, not raised.  Network failures raise
+        ``OSError`` or ``http.client.HTTPException``.  Idempotent requests
+        that hit a connection the server has dropped are retried once on a
+        fresh connection; others raise.
+        """
+        merged = {**self.headers, **headers} if headers else self.headers
+        conn, reused = self._acquire()
+        try:
+            try:
+                resp = self._send(conn, method, path, body, merged)
+            except _STALE_CONNECTION_ERRORS:
+                if not reused or method not in _IDEMPOTENT_METHODS:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once.
+                conn.close()
+                conn = self._connect()
+                resp = self._send(conn, method, path, body, merged)
+            data = resp.read()
+        except BaseException:
+            conn.close()
+            raise
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return Response(resp.status, resp.headers, data)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _connect(self) -> http.client.HTTPSConnection:
+        return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+
+    def _acquire(self) -> tuple[http.client.HTTPSConnection, bool]:
+        """Return ``(connection, reused)``."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPSConnection) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    @staticmethod
+    def _send(
+        conn: http.client.HTTPSConnection,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> http.client.HTTPResponse:
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse()
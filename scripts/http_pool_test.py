@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for http_pool.py."""
+from __future__ import annotations
+
+import http.client
+import unittest
+
+from http_pool import HTTPSPool
+
+
+class _FakeResponse:
+    status = 200
+    headers: dict[str, str] = {}
+    will_close = False
+
+    def read(self) -> bytes:
+        return b'{"ok": true}'
+
+
+class _FakeConnection:
+    """Connection that fails with ``RemoteDisconnected`` if *stale*."""
+
+    def __init__(self, stale: bool = False) -> None:
+        self.stale = stale
+        self.requests: list[str] = []
+        self.closed = False
+
+    def request(self, method: str, path: str, body=None, headers=None) -> None:
+        if self.stale:
+            raise http.client.RemoteDisconnected("closed by server")
+        self.requests.append(method)
+
+    def getresponse(self) -> _FakeResponse:
+        return _FakeResponse()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestHTTPSPool(unittest.TestCase):
+    """Tests for HTTPSPool."""
+
+    def setUp(self) -> None:
+        self.pool = HTTPSPool("example.com")
+        self.stale = _FakeConnection(stale=True)
+        self.fresh = _FakeConnection()
+        self.pool._idle.put_nowait(self.stale)
+        self.pool._connect = lambda: self.fresh
+
+    def test_idempotent_request_retried_on_stale_connection(self) -> None:
+        """Test that a GET on a dropped keep-alive connection is re-sent."""
+        resp = self.pool.request("GET", "/")
+
+        self.assertEqual(resp.json(), {"ok": True})
+        self.assertTrue(self.stale.closed)
+        self.assertEqual(self.fresh.requests, ["GET"])
+
+    def test_post_not_retried_on_stale_connection(self) -> None:
+        """Test that a POST on a dropped connection raises instead."""
+        with self.assertRaises(http.client.RemoteDisconnected):
+            self.pool.request("POST", "/", body=b"{}")
+
+        self.assertTrue(self.stale.closed)
+        self.assertEqual(self.fresh.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
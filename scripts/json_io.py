@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""JSON helpers shared by the benchmark scripts.
+
+Uses ``orjson`` when it is installed (a C parser, several times faster on
+number-heavy result files) and falls back to the stdlib ``json`` module, so
+no pip dependencies are required in CI.  :func:`load_json_cached` additionally
+shares one parse of a file across the steps of a job.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch one type.
+JSONDecodeError = json.JSONDecodeError
+
+_PARSED_CACHE_DIR = "benchmark-action-parsed"
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from *data*."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes, two-space indented if *indent*."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def load_json(path: str | os.PathLike[str]) -> Any:
+    """Read and parse the JSON file at *path*."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dump_json(obj: Any, path: str | os.PathLike[str]) -> None:
+    """Write *obj* to *path* as indented JSON with a trailing newline."""
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=True))
+        f.write(b"\n")
+
+
+def load_json_cached(path: str | os.PathLike[str]) -> Any:
+    """Like :func:`load_json`, but reuse a parse from an earlier job step.
+
+    Several steps read the same results and baseline files.  The first one
+    pickles the parsed object under ``$RUNNER_TEMP``, keyed by the file's
+    absolute path and stamped with its mtime and size; later steps load the
+    pickle instead of re-parsing.  The cache lives outside the workspace
+    because unpickling trusts its input, and is skipped when ``RUNNER_TEMP``
+    is unset (local runs).
+    """
+    runner_temp = os.environ.get("RUNNER_TEMP")
+    if not runner_temp:
+        return load_json(path)
+
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    cache_dir = Path(runner_temp, _PARSED_CACHE_DIR)
+    cache_path = cache_dir / f"{key}.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+        pass
+
+    data = load_json(path)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=cache_dir, suffix=".tmp", delete=False,
+        ) as f:
+            pickle.dump((stamp, data), f, protocol=5)
+        os.replace(f.name, cache_path)
+    except OSError:
+        pass
+    return data
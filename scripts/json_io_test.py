@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for json_io.py."""
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from json_io import dump_json, load_json, load_json_cached
+
+
+class TestLoadJsonCached(unittest.TestCase):
+    """Tests for load_json_cached."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.path = self.root / "results.json"
+        runner_temp = self.root / "runner_temp"
+        runner_temp.mkdir()
+        env = patch.dict(os.environ, {"RUNNER_TEMP": str(runner_temp)})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_round_trip_matches_load_json(self) -> None:
+        """Test that cached and uncached loads agree."""
+        dump_json({"benchmarks": {"fft": {"latency": {"value": 1.5}}}}, self.path)
+
+        first = load_json_cached(self.path)
+        second = load_json_cached(self.path)
+
+        self.assertEqual(first, load_json(self.path))
+        self.assertEqual(second, first)
+
+    def test_rewritten_file_is_reparsed(self) -> None:
+        """Test that a changed file invalidates the cached parse."""
+        dump_json({"value": 1}, self.path)
+        load_json_cached(self.path)
+
+        dump_json({"value": 22}, self.path)
+
+        self.assertEqual(load_json_cached(self.path), {"value": 22})
+
+    def test_without_runner_temp_reads_directly(self) -> None:
+        """Test that local runs (no RUNNER_TEMP) bypass the cache."""
+        dump_json({"value": 1}, self.path)
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(load_json_cached(self.path), {"value": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,11 @@
 """Generate GitHub Actions step summary with baseline comparison table."""
 from __future__ import annotations
 
-import json
 import os
 import sys
 from pathlib import Path
 
+from json_io import JSONDecodeError, load_json, load_json_cached
 from slack_chart import format_metric_value
 
 _METRICS = [
@@ -18,14 +18,13 @@ _METRICS = [
 ]
 
 
-def _print_system_load_info() -> None:
-    """Print system load information if available."""
+def _system_load_lines() -> list[str]:
+    """Return system load summary lines, or none if the data is unavailable."""
     system_load_file = Path(os.environ.get("SYSTEM_LOAD_OUTPUT", "system_load.json"))
     if not system_load_file.exists():
-        return
+        return []
 
-    with open(system_load_file) as f:
-        data = json.load(f)
+    data = load_json(system_load_file)
 
     cpu = data.get("cpu", {})
     mem = data.get("memory", {})
@@ -34,12 +33,15 @@ def _print_system_load_info() -> None:
     mem_usage = mem.get("usage_ratio", 0)
     mem_warning = mem.get("warning", False)
 
-    print("## System Load\n")
-    print("| Metric | Value | Status |")
-    print("|--------|------:|--------|")
-    print(f"| CPU Load | {cpu_load:.1%} | {'⚠️ High' if cpu_warning else '✅ OK'} |")
-    print(f"| Memory | {mem_usage:.1%} | {'⚠️ High' if mem_warning else '✅ OK'} |")
-    print()
+    return [
+        "## System Load",
+        "",
+        "| Metric | Value | Status |",
+        "|--------|------:|--------|",
+        f"| CPU Load | {cpu_load:.1%} | {'⚠️ High' if cpu_warning else '✅ OK'} |",
+        f"| Memory | {mem_usage:.1%} | {'⚠️ High' if mem_warning else '✅ OK'} |",
+        "",
+    ]
 
 
 def _load_regression_details() -> dict:
@@ -48,9 +50,8 @@ def _load_regression_details() -> dict:
     if not details_file.exists():
         return {}
     try:
-        with open(details_file) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, KeyError):
+        return load_json(details_file)
+    except (JSONDecodeError, KeyError):
         return {}
 
 
@@ -60,31 +61,31 @@ def _load_baseline() -> dict:
     if not baseline_path.exists():
         return {}
     try:
-        with open(baseline_path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, KeyError):
+        return load_json_cached(baseline_path)
+    except (JSONDecodeError, KeyError):
         return {}
 
 
 def main() -> int:
     results_file = os.environ.get("RESULTS_FILE", "benchmark_results.json")
 
-    with open(results_file) as f:
-        data = json.load(f)
+    data = load_json_cached(results_file)
 
-    _print_system_load_info()
+    # Collect the whole summary and write it once instead of per row.
+    lines = _system_load_lines()
 
     details = _load_regression_details()
     baseline = _load_baseline()
     has_details = bool(details.get("benchmarks"))
     has_baseline = bool(baseline.get("benchmarks"))
 
-    print("## Benchmark Results\n")
+    lines.append("## Benchmark Results")
+    lines.append("")
 
     if has_details or has_baseline:
         # Comparison table with baseline
-        print("| Benchmark | Metric | Current | Baseline | Change | Status |")
-        print("|-----------|--------|--------:|---------:|-------:|:------:|")
+        lines.append("| Benchmark | Metric | Current | Baseline | Change | Status |")
+        lines.append("|-----------|--------|--------:|---------:|-------:|:------:|")
 
         for name, bench in data.get("benchmarks", {}).items():
             bench_details = details.get("benchmarks", {}).get(name, {})
@@ -106,7 +107,7 @@ def main() -> int:
                     pct = detail["change_pct"]
                     is_regression = detail["direction"] == "regression"
                     status = "🔴" if is_regression else "🟢"
-                    print(f"| {name} | {label} | {curr_fmt} | {base_fmt} | {pct:+.1f}% | {status} |")
+                    lines.append(f"| {name} | {label} | {curr_fmt} | {base_fmt} | {pct:+.1f}% | {status} |")
                 elif base_bench.get(key, {}).get("value"):
                     base_val = base_bench[key]["value"]
                     base_fmt = format_metric_value(base_val, unit)
@@ -118,22 +119,22 @@ def main() -> int:
                         else:
                             is_regression = pct < 0
                         status = "🔴" if is_regression and abs(pct) > 5 else "🟢" if abs(pct) > 5 else "➖"
-                        print(f"| {name} | {label} | {curr_fmt} | {base_fmt} | {pct:+.1f}% | {status} |")
+                        lines.append(f"| {name} | {label} | {curr_fmt} | {base_fmt} | {pct:+.1f}% | {status} |")
                     else:
-                        print(f"| {name} | {label} | {curr_fmt} | — | — | ➖ |")
+                        lines.append(f"| {name} | {label} | {curr_fmt} | — | — | ➖ |")
                 else:
-                    print(f"| {name} | {label} | {curr_fmt} | — | — | ➖ |")
+                    lines.append(f"| {name} | {label} | {curr_fmt} | — | — | ➖ |")
 
             # Test vector verification
             tv = bench.get("test_vectors", {})
             ver = tv.get("verified", False) if tv else False
             if tv:
                 ver_status = "✅" if ver else "❌"
-                print(f"| {name} | Vectors | {ver_status} | — | — | {'✅' if ver else '❌'} |")
+                lines.append(f"| {name} | Vectors | {ver_status} | — | — | {'✅' if ver else '❌'} |")
     else:
         # No baseline — simple table
-        print("| Benchmark | Latency | Throughput | Memory | Verified |")
-        print("|-----------|--------:|-----------:|-------:|---------:|")
+        lines.append("| Benchmark | Latency | Throughput | Memory | Verified |")
+        lines.append("|-----------|--------:|-----------:|-------:|---------:|")
 
         for name, bench in data.get("benchmarks", {}).items():
             lat = bench.get("latency", {}).get("value")
@@ -149,9 +150,9 @@ def main() -> int:
             mem_str = format_metric_value(mem, mem_unit) if mem is not None else "—"
             ver_str = "✅" if ver else "❌"
 
-            print(f"| {name} | {lat_str} | {thr_str} | {mem_str} | {ver_str} |")
+            lines.append(f"| {name} | {lat_str} | {thr_str} | {mem_str} | {ver_str} |")
 
-    print()
+    sys.stdout.write("\n".join(lines) + "\n\n")
     return 0
 
 
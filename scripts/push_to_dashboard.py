@@ -5,19 +5,22 @@
 
 Reads benchmark_results.json, splits each benchmark into a separate file
 ``data-v2/{repo}-{name}-{device}.json``, and pushes all files + manifest in a
-single atomic commit.  Uses only stdlib (urllib, json, base64) so no pip
-dependencies are needed in CI.
+single atomic commit.  Uses only stdlib (http.client, json) so no pip
+dependencies are needed in CI; ``orjson`` is used when available.
 """
 from __future__ import annotations
 
-import base64
 import json
 import os
+import random
 import sys
-import urllib.error
-import urllib.request
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from http_pool import HTTPSPool, Response
+from json_io import dumps, load_json_cached, loads
+
 # ---------------------------------------------------------------------------
 # Config from environment
 # ---------------------------------------------------------------------------
@@ -41,39 +44,137 @@ SOURCE_REPO = _source_repo
 # ---------------------------------------------------------------------------
 
 
-def _api_headers() -> dict[str, str]:
-    return {
-        "Authorization": f"token {DASHBOARD_TOKEN}",
-        "Accept": "application/vnd.github.v3+json",
-        "Content-Type": "application/json",
-    }
+_API_HEADERS = {
+    "Authorization": f"token {DASHBOARD_TOKEN}",
+    "Accept": "application/vnd.github.v3+json",
+    "Content-Type": "application/json",
+}
+
+
+# Retry policy: exponential backoff with jitter, capped.
+MAX_RETRIES = 5
+_BACKOFF_BASE = 1.0  # seconds
+_BACKOFF_JITTER = 0.5
+_BACKOFF_CAP = 30.0  # seconds
+# Rate limiting / transient server errors, retried as-is.  GitHub's
+# secondary rate limit answers 403 with Retry-After; other 403s are final.
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+# A ref update is rejected with these when the branch is no longer a
+# fast-forward of the commit we built on.
+_CONFLICT_STATUSES = frozenset({409, 422})
+
+# Kept small: GitHub discourages concurrent REST requests and enforces a
+# secondary rate limit on them.
+_MAX_FETCH_WORKERS = 4
+# Contents API media type returning the file body as-is (no base64 wrapper).
+_RAW_MEDIA_TYPE = "application/vnd.github.raw+json"
+
+# One pool for every call in a run, so they all share a TLS session.
+_GITHUB = HTTPSPool(
+    "api.github.com", headers=_API_HEADERS, timeout=60, maxsize=_MAX_FETCH_WORKERS,
+)
+
+
+class GitHubAPIError(RuntimeError):
+    """A GitHub API call returned an error or redirect status.
+
+    ``http.client`` does not follow redirects; GitHub answers 301/307 for a
+    renamed or transferred repo, so those are reported with their target.
+    """
+
+    def __init__(self, method: str, path: str, resp: Response) -> None:
+        if 300 <= resp.status < 400:
+            message = (
+                f"{method} {path} was redirected: HTTP {resp.status} to "
+                f"{resp.headers.get('Location')} (was DASHBOARD_REPO renamed?)"
+            )
+        else:
+            message = (
+                f"{method} {path} failed: HTTP {resp.status}: "
+                f"{resp.body.decode(errors='replace')[:500]}"
+            )
+        super().__init__(message)
+        self.status = resp.status
+        self.headers = resp.headers
+
+
+class RefUpdateConflict(GitHubAPIError):
+    """The branch moved since the push started (not a fast-forward)."""
+
+
+def _backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Exponential backoff with jitter, preferring a server ``Retry-After``."""
+    if retry_after:
+        try:
+            return min(_BACKOFF_CAP, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; use the computed backoff instead
+    delay = _BACKOFF_BASE * 2**attempt * (1 + random.random() * _BACKOFF_JITTER)
+    return min(_BACKOFF_CAP, delay)
+
+
+def _request(
+    method: str,
+    path: str,
+    body: bytes | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Send a request, retrying rate-limited and transient server errors."""
+    for attempt in range(MAX_RETRIES):
+        resp = _GITHUB.request(method, path, body=body, headers=headers)
+        retry_after = resp.headers.get("Retry-After")
+        transient = resp.status in _TRANSIENT_STATUSES or (
+            resp.status == 403 and retry_after is not None
+        )
+        if not transient or attempt == MAX_RETRIES - 1:
+            return resp
+        delay = _backoff_delay(attempt, retry_after)
+        print(f"{method} {path}: HTTP {resp.status}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+    return resp
 
 
 def _api(method: str, endpoint: str, body: dict | None = None) -> dict:
     """Call the GitHub API and return parsed JSON response."""
-    url = f"https://api.github.com/repos/{DASHBOARD_REPO}/{endpoint}"
-    data = json.dumps(body).encode() if body else None
-    req = urllib.request.Request(url, data=data, headers=_api_headers(), method=method)
-    with urllib.request.urlopen(req) as resp:
-        return json.loads(resp.read())
+    path = f"/repos/{DASHBOARD_REPO}/{endpoint}"
+    data = dumps(body) if body else None
+    resp = _request(method, path, body=data)
+    if resp.status in _CONFLICT_STATUSES and method == "PATCH":
+        raise RefUpdateConflict(method, path, resp)
+    if resp.status >= 300:
+        raise GitHubAPIError(method, path, resp)
+    return resp.json()
 
 
-def get_file_content(path: str) -> tuple[dict | None, str | None]:
+def get_file_content(path: str) -> dict | None:
     """GET a JSON file from the dashboard repo via Contents API.
 
-    Returns ``(parsed_json, blob_sha)`` or ``(None, None)`` on 404.
+    Requests the raw media type, so the body is the file itself rather than
+    a base64-encoded copy wrapped in JSON metadata.
+
+    Returns the parsed JSON, or ``None`` on 404.
     """
-    url = f"https://api.github.com/repos/{DASHBOARD_REPO}/contents/{path}"
-    req = urllib.request.Request(url, headers=_api_headers())
-    try:
-        with urllib.request.urlopen(req) as resp:
-            data = json.loads(resp.read())
-            content = base64.b64decode(data["content"]).decode()
-            return json.loads(content), data["sha"]
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return None, None
-        raise
+    api_path = f"/repos/{DASHBOARD_REPO}/contents/{path}"
+    resp = _request("GET", api_path, headers={"Accept": _RAW_MEDIA_TYPE})
+    if resp.status == 404:
+        return None
+    if resp.status >= 300:
+        raise GitHubAPIError("GET", api_path, resp)
+    return loads(resp.body)
+
+
+def fetch_files(paths: list[str]) -> dict[str, dict | None]:
+    """GET several dashboard files concurrently.
+
+    Returns ``path -> parsed_json`` (``None`` for files that don't exist yet).
+    The requests are independent, so total latency is roughly that of the
+    slowest one rather than the sum.
+    """
+    unique = list(dict.fromkeys(paths))
+    workers = min(len(unique), _MAX_FETCH_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        contents = ex.map(get_file_content, unique)
+        return dict(zip(unique, contents))
 
 
 # ---------------------------------------------------------------------------
@@ -88,8 +189,10 @@ def push_atomic_commit(files: dict[str, dict], message: str) -> None:
         files: mapping of ``path -> json_content`` to create/update.
         message: commit message.
 
-    Flow: get ref → get base tree → create blobs → create tree →
-          create commit → update ref.
+    Flow: get ref → get base tree → create tree → create commit → update ref.
+
+    File contents are sent inline in the tree request, so GitHub creates the
+    blobs server-side instead of taking one ``POST git/blobs`` per file.
     """
     # 1. Get HEAD ref
     ref_data = _api("GET", "git/ref/heads/main")
@@ -99,27 +202,20 @@ def push_atomic_commit(files: dict[str, dict], message: str) -> None:
     commit_data = _api("GET", f"git/commits/{head_sha}")
     base_tree_sha = commit_data["tree"]["sha"]
 
-    # 3. Create blobs for each file
-    tree_items: list[dict] = []
-    for path, content in files.items():
-        blob = _api(
-            "POST",
-            "git/blobs",
-            {
-                "content": json.dumps(content, indent=2),
-                "encoding": "utf-8",
-            },
-        )
-        tree_items.append(
-            {
-                "path": path,
-                "mode": "100644",
-                "type": "blob",
-                "sha": blob["sha"],
-            }
-        )
-
-    # 4. Create tree
+    # 3. Build tree entries with inline content.  Committed files always use
+    # the stdlib encoder so their bytes don't depend on whether the runner
+    # has orjson (which skips ensure_ascii and formats floats differently).
+    tree_items = [
+        {
+            "path": path,
+            "mode": "100644",
+            "type": "blob",
+            "content": json.dumps(content, indent=2),
+        }
+        for path, content in files.items()
+    ]
+
+    # 4. Create tree (and its blobs)
     tree = _api(
         "POST",
         "git/trees",
@@ -183,39 +279,21 @@ def normalize_metrics(bench: dict) -> dict:
     return metrics
 
 
-# ---------------------------------------------------------------------------
-# Main
-# ---------------------------------------------------------------------------
-
-
-def main() -> int:
-    # 1. Read benchmark results
-    with open(RESULTS_FILE) as f:
-        results = json.load(f)
-
-    raw_benchmarks = results.get("benchmarks", {})
-    if not raw_benchmarks:
-        print("No benchmarks found in results file")
-        return 1
-
-    raw_platform = (
-        results.get("metadata", {}).get("platform") or results.get("platform") or {}
-    )
-    platform = normalize_platform(raw_platform)
-
-    commit_sha = GITHUB_SHA
-    timestamp = datetime.now(timezone.utc).isoformat()
+def build_files_to_push(
+    raw_benchmarks: dict, new_result: dict,
+) -> tuple[dict[str, dict], list[str]]:
+    """Fetch the current dashboard files and merge *new_result* into them.
 
-    # 2. Build per-benchmark result entries
-    new_result = {
-        "commit": commit_sha,
-        "timestamp": timestamp,
-        "platform": platform,
-    }
+    Returns ``(path -> json_content, benchmark_file_keys)``.
+    """
+    commit_sha = new_result["commit"]
+    timestamp = new_result["timestamp"]
 
-    # 3. Load existing benchmark files & manifest, prepare updates
+    manifest_path = "data-v2/manifest.json"
     files_to_push: dict[str, dict] = {}
     benchmark_keys: list[str] = []
+    file_paths: list[str] = []
+    bench_files: list[tuple[str, str, str, str, str, dict]] = []
 
     for bench_key, bench_data in raw_benchmarks.items():
         # bench_key may be "name/degree" (zkbench compound key) or plain "name".
@@ -227,8 +305,16 @@ def main() -> int:
         file_key = f"{SOURCE_REPO}-{field}-{degree}-{bench_name}-{DEVICE}"
         file_path = f"data-v2/{file_key}.json"
         benchmark_keys.append(file_key)
+        file_paths.append(file_path)
+        bench_files.append(
+            (bench_name, field, degree, file_key, file_path, bench_data)
+        )
+
+    # The GETs are independent; fetch them all at once.
+    fetched = fetch_files(file_paths + [manifest_path])
 
-        existing, _ = get_file_content(file_path)
+    for bench_name, field, degree, file_key, file_path, bench_data in bench_files:
+        existing = fetched[file_path]
 
         if existing is None:
             existing = {
@@ -243,41 +329,90 @@ def main() -> int:
         # Build result with metrics for this benchmark
         result_entry = {**new_result, "metrics": normalize_metrics(bench_data)}
 
-        # Deduplicate by commit SHA
-        existing_commits = {r["commit"] for r in existing["results"]}
-        if commit_sha not in existing_commits:
-            existing["results"].insert(0, result_entry)
+        # Deduplicate by commit SHA: replace in place, else prepend (the
+        # dashboard reads results newest-first).
+        results = existing["results"]
+        index = next(
+            (i for i, r in enumerate(results) if r["commit"] == commit_sha), None,
+        )
+        if index is None:
+            results.insert(0, result_entry)
         else:
             print(f"  Commit {commit_sha[:7]} already exists in {file_key}, updating")
-            existing["results"] = [
-                result_entry if r["commit"] == commit_sha else r
-                for r in existing["results"]
-            ]
+            results[index] = result_entry
 
         files_to_push[file_path] = existing
 
-    # 4. Update manifest
-    manifest_path = "data-v2/manifest.json"
-    manifest, _ = get_file_content(manifest_path)
+    # Update manifest
+    manifest = fetched[manifest_path]
 
     if manifest is None:
         manifest = {"benchmarks": [], "lastUpdated": timestamp}
 
-    existing_benchmarks = set(manifest.get("benchmarks", []))
-    existing_benchmarks.update(benchmark_keys)
-    manifest["benchmarks"] = sorted(existing_benchmarks)
+    # The manifest is kept sorted; only re-sort when a key is actually new,
+    # which after the first run for a benchmark it almost never is.
+    listed = manifest.get("benchmarks", [])
+    known = set(listed)
+    if any(key not in known for key in benchmark_keys):
+        listed = sorted(known.union(benchmark_keys))
+    manifest["benchmarks"] = listed
     manifest["lastUpdated"] = timestamp
 
     files_to_push[manifest_path] = manifest
 
-    # 5. Push all files in one atomic commit
+    return files_to_push, benchmark_keys
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> int:
+    # 1. Read benchmark results
+    results = load_json_cached(RESULTS_FILE)
+
+    raw_benchmarks = results.get("benchmarks", {})
+    if not raw_benchmarks:
+        print("No benchmarks found in results file")
+        return 1
+
+    raw_platform = (
+        results.get("metadata", {}).get("platform") or results.get("platform") or {}
+    )
+    platform = normalize_platform(raw_platform)
+
+    commit_sha = GITHUB_SHA
+    timestamp = datetime.now(timezone.utc).isoformat()
+
+    # 2. Build per-benchmark result entries
+    new_result = {
+        "commit": commit_sha,
+        "timestamp": timestamp,
+        "platform": platform,
+    }
+
+    # 3. Merge into the current dashboard files and push them in one atomic
+    # commit.  If another run moved the branch in between, the ref update is
+    # rejected; re-fetch and rebuild so its changes (e.g. to the shared
+    # manifest) aren't overwritten.
     short_sha = commit_sha[:7] if commit_sha else "unknown"
     bench_names = ", ".join(sorted(raw_benchmarks.keys()))
     commit_msg = (
         f"chore: update {SOURCE_REPO} benchmarks ({short_sha})\n\n{bench_names}"
     )
 
-    push_atomic_commit(files_to_push, commit_msg)
+    for attempt in range(MAX_RETRIES):
+        files_to_push, benchmark_keys = build_files_to_push(raw_benchmarks, new_result)
+        try:
+            push_atomic_commit(files_to_push, commit_msg)
+            break
+        except RefUpdateConflict:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            delay = _backoff_delay(attempt)
+            print(f"Dashboard branch moved during push, retrying in {delay:.1f}s")
+            time.sleep(delay)
 
     print(f"Pushed {len(files_to_push) - 1} benchmark file(s) + manifest")
     for key in sorted(benchmark_keys):
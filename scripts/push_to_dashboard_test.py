@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# Copyright 2026 Fractalyze Authors.
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for push_to_dashboard.py."""
+from __future__ import annotations
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+# push_to_dashboard reads its required config at import time.
+os.environ.setdefault("DASHBOARD_TOKEN", "test-token")
+os.environ.setdefault("DASHBOARD_REPO", "owner/dashboard")
+os.environ.setdefault("DEVICE", "cpu")
+
+import push_to_dashboard  # noqa: E402
+from http_pool import Response  # noqa: E402
+from push_to_dashboard import (  # noqa: E402
+    MAX_RETRIES,
+    GitHubAPIError,
+    RefUpdateConflict,
+    _api,
+    _request,
+    get_file_content,
+    push_atomic_commit,
+)
+
+_MANIFEST = "data-v2/manifest.json"
+
+
+class _FakeGitHub:
+    """Minimal in-memory stand-in for the GitHub API behind ``_GITHUB``.
+
+    ``failures`` maps ``(method, endpoint)`` to a list of
+    ``(status, headers)`` answers returned, in order, before the call is
+    handled normally.  ``on_failure`` runs whenever one is returned.
+    """
+
+    def __init__(self) -> None:
+        self.files: dict[str, dict] = {}
+        self.head = "c0"
+        self.failures: dict[tuple[str, str], list[tuple[int, dict]]] = {}
+        self.on_failure = lambda: None
+        self.calls: list[tuple[str, str]] = []
+        self.pushed_text: dict[str, str] = {}
+        self._trees: dict[str, dict[str, dict]] = {}
+        self._commits: dict[str, str] = {}
+
+    def request(self, method, path, body=None, headers=None) -> Response:
+        endpoint = path.removeprefix("/repos/owner/dashboard/")
+        self.calls.append((method, endpoint))
+        pending = self.failures.get((method, endpoint))
+        if pending:
+            status, resp_headers = pending.pop(0)
+            self.on_failure()
+            return Response(status, resp_headers, b'{"message": "error"}')
+        payload = json.loads(body) if body else None
+
+        if endpoint.startswith("contents/"):
+            content = self.files.get(endpoint.removeprefix("contents/"))
+            if content is None:
+                return Response(404, {}, b'{"message": "Not Found"}')
+            return self._ok(content)
+        if endpoint == "git/ref/heads/main":
+            return self._ok({"object": {"sha": self.head}})
+        if endpoint.startswith("git/commits/"):
+            return self._ok({"tree": {"sha": f"tree-of-{self.head}"}})
+        if endpoint == "git/trees":
+            sha = f"t{len(self._trees)}"
+            for item in payload["tree"]:
+                self.pushed_text[item["path"]] = item["content"]
+            self._trees[sha] = {
+                item["path"]: json.loads(item["content"]) for item in payload["tree"]
+            }
+            return self._ok({"sha": sha})
+        if endpoint == "git/commits":
+            sha = f"c{len(self._commits) + 1}"
+            self._commits[sha] = payload["tree"]
+            return self._ok({"sha": sha})
+        if endpoint == "git/refs/heads/main":
+            self.head = payload["sha"]
+            self.files.update(self._trees[self._commits[self.head]])
+            return self._ok({"object": {"sha": self.head}})
+        raise AssertionError(f"unexpected request: {method} {endpoint}")
+
+    @staticmethod
+    def _ok(data: dict) -> Response:
+        return Response(200, {}, json.dumps(data).encode())
+
+
+class _GitHubTestCase(unittest.TestCase):
+    """Routes API calls to a _FakeGitHub and records sleeps."""
+
+    def setUp(self) -> None:
+        self.github = _FakeGitHub()
+        self.sleeps: list[float] = []
+        for owner, name, value in (
+            (push_to_dashboard, "_GITHUB", self.github),
+            (push_to_dashboard.time, "sleep", self.sleeps.append),
+        ):
+            patcher = patch.object(owner, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestRequest(_GitHubTestCase):
+    """Tests for _request retry handling."""
+
+    def _get_ref(self) -> Response:
+        with redirect_stdout(io.StringIO()):
+            return _request("GET", "/repos/owner/dashboard/git/ref/heads/main")
+
+    def test_transient_status_honors_retry_after(self) -> None:
+        """Test that a 503 is retried after the server's Retry-After delay."""
+        self.github.failures[("GET", "git/ref/heads/main")] = [
+            (503, {"Retry-After": "7"}),
+        ]
+
+        resp = self._get_ref()
+
+        self.assertEqual(resp.status, 200)
+        self.assertEqual(self.sleeps, [7.0])
+
+    def test_secondary_rate_limit_403_is_retried(self) -> None:
+        """Test that a 403 carrying Retry-After is retried."""
+        self.github.failures[("GET", "git/ref/heads/main")] = [
+            (403, {"Retry-After": "2"}),
+        ]
+
+        self.assertEqual(self._get_ref().status, 200)
+        self.assertEqual(self.sleeps, [2.0])
+
+    def test_plain_403_is_not_retried(self) -> None:
+        """Test that a 403 without Retry-After is returned as-is."""
+        self.github.failures[("GET", "git/ref/heads/main")] = [(403, {})]
+
+        self.assertEqual(self._get_ref().status, 403)
+        self.assertEqual(self.sleeps, [])
+
+    def test_gives_up_after_max_retries(self) -> None:
+        """Test that the last transient response is returned unretried."""
+        self.github.failures[("GET", "git/ref/heads/main")] = [
+            (502, {}) for _ in range(MAX_RETRIES)
+        ]
+
+        self.assertEqual(self._get_ref().status, 502)
+        self.assertEqual(len(self.sleeps), MAX_RETRIES - 1)
+
+
+class TestRedirects(_GitHubTestCase):
+    """Tests that 3xx answers are reported rather than parsed."""
+
+    _MOVED = {"Location": "https://api.github.com/repositories/42/git/ref/x"}
+
+    def test_api_redirect_names_location(self) -> None:
+        """Test that a 301 from _api raises with the redirect target."""
+        self.github.failures[("GET", "git/ref/heads/main")] = [(301, self._MOVED)]
+
+        with self.assertRaisesRegex(GitHubAPIError, "redirected: HTTP 301 to .*/42/"):
+            _api("GET", "git/ref/heads/main")
+
+    def test_file_fetch_redirect_is_an_error(self) -> None:
+        """Test that a 307 on a Contents GET is not mistaken for the file."""
+        self.github.failures[("GET", f"contents/{_MANIFEST}")] = [(307, self._MOVED)]
+
+        with self.assertRaisesRegex(GitHubAPIError, "HTTP 307"):
+            get_file_content(_MANIFEST)
+
+
+class TestPushAtomicCommit(_GitHubTestCase):
+    """Tests for push_atomic_commit."""
+
+    def test_content_uses_stdlib_encoding(self) -> None:
+        """Test that committed files match json.dumps whatever the backend."""
+        content = {"name": "Poseidon2 über", "value": 1e-07, "mean": 100.0}
+
+        with redirect_stdout(io.StringIO()):
+            push_atomic_commit({"data-v2/x.json": content}, "msg")
+
+        self.assertEqual(
+            self.github.pushed_text["data-v2/x.json"],
+            json.dumps(content, indent=2),
+        )
+
+
+class TestMain(_GitHubTestCase):
+    """Tests for main's fetch/merge/push loop."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        results_file = Path(self._tmp.name, "benchmark_results.json")
+        results_file.write_text(json.dumps({
+            "benchmarks": {
+                "fft": {
+                    "latency": {"value": 100.0, "unit": "ns"},
+                    "metadata": {"field": "kb", "degree": "20"},
+                },
+            },
+        }))
+        for name, value in (
+            ("RESULTS_FILE", str(results_file)),
+            ("GITHUB_SHA", "abcdef0123"),
+            ("SOURCE_REPO", "zkx"),
+            ("_backoff_delay", lambda attempt, retry_after=None: 0.0),
+        ):
+            patcher = patch.object(push_to_dashboard, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _main(self) -> int:
+        with redirect_stdout(io.StringIO()):
+            return push_to_dashboard.main()
+
+    def test_pushes_benchmark_file_and_manifest(self) -> None:
+        """Test that a clean run pushes the new result and manifest."""
+        self.assertEqual(self._main(), 0)
+
+        bench = self.github.files["data-v2/zkx-kb-20-fft-cpu.json"]
+        self.assertEqual([r["commit"] for r in bench["results"]], ["abcdef0123"])
+        self.assertEqual(
+            self.github.files[_MANIFEST]["benchmarks"], ["zkx-kb-20-fft-cpu"],
+        )
+
+    def test_rejected_ref_update_rebuilds_from_new_head(self) -> None:
+        """Test that a 422 on the ref update re-fetches before retrying."""
+        self.github.failures[("PATCH", "git/refs/heads/main")] = [(422, {})]
+
+        def other_run_pushes() -> None:
+            self.github.files[_MANIFEST] = {
+                "benchmarks": ["zkx-kb-20-ntt-cpu"], "lastUpdated": "x",
+            }
+
+        self.github.on_failure = other_run_pushes
+
+        self.assertEqual(self._main(), 0)
+
+        manifest_gets = self.github.calls.count(("GET", f"contents/{_MANIFEST}"))
+        self.assertEqual(manifest_gets, 2)
+        self.assertEqual(
+            self.github.files[_MANIFEST]["benchmarks"],
+            ["zkx-kb-20-fft-cpu", "zkx-kb-20-ntt-cpu"],
+        )
+
+    def test_conflict_reraised_after_max_retries(self) -> None:
+        """Test that a ref update rejected every time eventually raises."""
+        self.github.failures[("PATCH", "git/refs/heads/main")] = [
+            (409, {}) for _ in range(MAX_RETRIES)
+        ]
+
+        with self.assertRaises(RefUpdateConflict):
+            self._main()
+
+        patches = self.github.calls.count(("PATCH", "git/refs/heads/main"))
+        self.assertEqual(patches, MAX_RETRIES)
+
+    def test_conflict_status_only_rebuilds_for_ref_update(self) -> None:
+        """Test that a 422 from a non-PATCH call is a plain API error."""
+        self.github.failures[("POST", "git/trees")] = [(422, {})]
+
+        with self.assertRaises(GitHubAPIError) as ctx:
+            self._main()
+
+        self.assertNotIsInstance(ctx.exception, RefUpdateConflict)
+        self.assertEqual(self.github.calls.count(("POST", "git/trees")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,12 +10,12 @@ Supports two modes:
 """
 from __future__ import annotations
 
-import json
 import os
 import sys
 import urllib.request
 from pathlib import Path
 
+from json_io import JSONDecodeError, dumps, load_json, loads
 from slack_chart import (
     build_dashboard_url,
     format_metric_value,
@@ -38,6 +38,7 @@ _METRIC_LABELS = {
 }
 
 _MAX_BENCHMARKS = 5  # Block Kit 50-block limit safeguard
+_MAX_AI_INLINE_LINES = 5  # webhook mode has no thread for the full report
 
 
 # ---------------------------------------------------------------------------
@@ -105,25 +106,27 @@ def _build_ai_inline_block(ai_analysis_file: Path) -> list[dict]:
     if not ai_analysis_file.exists():
         return []
 
-    text = ai_analysis_file.read_text().strip()
-    lines = text.split("\n")
-
+    # Only the first few analysis lines are shown; stop reading once we have
+    # them rather than loading the whole report.
     analysis_lines: list[str] = []
     in_analysis = False
-    for line in lines:
-        if line.startswith("### Analysis"):
-            in_analysis = True
-            continue
-        if in_analysis and line.startswith("##"):
-            break
-        if in_analysis and line.strip():
-            analysis_lines.append(line)
+    with ai_analysis_file.open() as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line.startswith("### Analysis"):
+                in_analysis = True
+                continue
+            if in_analysis and line.startswith("##"):
+                break
+            if in_analysis and line.strip():
+                analysis_lines.append(line.replace("**", "*"))
+                if len(analysis_lines) == _MAX_AI_INLINE_LINES:
+                    break
 
     if not analysis_lines:
         return []
 
-    analysis_lines = [line.replace("**", "*") for line in analysis_lines]
-    analysis_text = "\n".join(analysis_lines[:5])
+    analysis_text = "\n".join(analysis_lines)
     return [
         {"type": "divider"},
         {
@@ -137,12 +140,11 @@ def _build_ai_inline_block(ai_analysis_file: Path) -> list[dict]:
 # Sending
 # ---------------------------------------------------------------------------
 
-def _send_via_bot(token: str, channel: str, blocks: list[dict]) -> str | None:
-    """Post message via chat.postMessage, return ``ts`` for threading."""
-    payload = {"channel": channel, "blocks": blocks}
+def _post_message(token: str, payload: dict, what: str) -> dict | None:
+    """Call ``chat.postMessage``; return the response, or ``None`` on error."""
     req = urllib.request.Request(
         "https://slack.com/api/chat.postMessage",
-        data=json.dumps(payload).encode(),
+        data=dumps(payload),
         headers={
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
@@ -150,14 +152,22 @@ def _send_via_bot(token: str, channel: str, blocks: list[dict]) -> str | None:
     )
     try:
         with urllib.request.urlopen(req) as resp:
-            data = json.loads(resp.read().decode())
-        if data.get("ok"):
-            return data.get("ts")
-        print(f"Slack API error: {data.get('error')}")
-        return None
+            data = loads(resp.read())
     except urllib.error.URLError as e:
-        print(f"Failed to send Slack message: {e}")
+        print(f"Failed to send {what}: {e}")
+        return None
+    if not data.get("ok"):
+        print(f"Slack API error ({what}): {data.get('error')}")
         return None
+    return data
+
+
+def _send_via_bot(token: str, channel: str, blocks: list[dict]) -> str | None:
+    """Post message via chat.postMessage, return ``ts`` for threading."""
+    data = _post_message(
+        token, {"channel": channel, "blocks": blocks}, "Slack message",
+    )
+    return data.get("ts") if data else None
 
 
 def _send_thread_reply(
@@ -180,21 +190,7 @@ def _send_thread_reply(
         "thread_ts": thread_ts,
         "blocks": blocks,
     }
-    req = urllib.request.Request(
-        "https://slack.com/api/chat.postMessage",
-        data=json.dumps(payload).encode(),
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        },
-    )
-    try:
-        with urllib.request.urlopen(req) as resp:
-            data = json.loads(resp.read().decode())
-        if not data.get("ok"):
-            print(f"Thread reply error: {data.get('error')}")
-    except urllib.error.URLError as e:
-        print(f"Failed to send thread reply: {e}")
+    _post_message(token, payload, "thread reply")
 
 
 def _send_via_webhook(webhook_url: str, blocks: list[dict]) -> bool:
@@ -202,7 +198,7 @@ def _send_via_webhook(webhook_url: str, blocks: list[dict]) -> bool:
     payload = {"blocks": blocks}
     req = urllib.request.Request(
         webhook_url,
-        data=json.dumps(payload).encode(),
+        data=dumps(payload),
         headers={"Content-Type": "application/json"},
     )
     try:
@@ -248,10 +244,9 @@ def main() -> int:
 
     # Read commit + PR info
     try:
-        with open(results_file) as f:
-            data = json.load(f)
+        data = load_json(results_file)
         commit = data["metadata"]["commit_sha"][:7]
-    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+    except (FileNotFoundError, JSONDecodeError, KeyError, TypeError):
         commit = os.environ.get("GITHUB_SHA", "unknown")[:7]
 
     pr_number = os.environ.get("PR_NUMBER", "")
@@ -285,8 +280,7 @@ def main() -> int:
     details: dict = {}
     details_path = Path(details_file)
     if details_path.exists():
-        with open(details_path) as f:
-            details = json.load(f)
+        details = load_json(details_path)
 
     benchmarks = details.get("benchmarks", {})
     sorted_benchmarks = sorted(
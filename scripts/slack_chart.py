@@ -7,10 +7,11 @@ Used by ``send_slack_alert.py`` to render human-readable benchmark reports.
 """
 from __future__ import annotations
 
-import json
 import urllib.request
 from typing import Any
 
+from json_io import JSONDecodeError, loads
+
 _SPARK_CHARS = "▁▂▃▄▅▆▇█"
 
 _DASHBOARD_BASE = "https://fractalyze.github.io/benchmark-dashboard/"
@@ -101,8 +102,8 @@ def load_history_from_dashboard(
     req = urllib.request.Request(url, headers=headers)
     try:
         with urllib.request.urlopen(req, timeout=15) as resp:
-            data: dict[str, Any] = json.loads(resp.read().decode())
-    except (urllib.error.URLError, json.JSONDecodeError):
+            data: dict[str, Any] = loads(resp.read())
+    except (urllib.error.URLError, JSONDecodeError):
         return [], []
 
     results = data.get("results", [])
@@ -112,7 +113,9 @@ def load_history_from_dashboard(
     commits: list[str] = []
     values: list[float] = []
     for r in results[-limit:]:
-        val = (r.get("metrics", {}).get(metric, {}) or {}).get("value")
+        metrics = r.get("metrics")
+        entry = metrics.get(metric) if metrics else None
+        val = entry.get("value") if entry else None
         if val is not None:
             commits.append((r.get("commit", "") or "")[:7])
             values.append(val)
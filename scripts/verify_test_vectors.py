@@ -5,8 +5,15 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
+from itertools import islice
+
+from json_io import load_json_cached
+
+
+def _is_verified(bench: dict) -> bool:
+    tv = bench.get("test_vectors")
+    return bool(tv and tv.get("verified", False))
 
 
 def main() -> int:
@@ -16,19 +23,28 @@ def main() -> int:
         required=True,
         help="Path to benchmark results JSON",
     )
+    parser.add_argument(
+        "--list-failures",
+        action="store_true",
+        help="Check every benchmark and list all failures, not just the first",
+    )
     args = parser.parse_args()
 
-    with open(args.results) as f:
-        data = json.load(f)
-
-    failed = []
-    for name, bench in data.get("benchmarks", {}).items():
-        tv = bench.get("test_vectors", {})
-        if not tv.get("verified", False):
-            failed.append(name)
+    data = load_json_cached(args.results)
+    failures = (
+        name
+        for name, bench in data.get("benchmarks", {}).items()
+        if not _is_verified(bench)
+    )
+    # Any failure fails the run, so unless asked for all, stop at the first.
+    failed = list(failures if args.list_failures else islice(failures, 1))
 
     if failed:
-        print(f"ERROR: Test vector verification failed for: {', '.join(failed)}")
+        hint = (
+            "" if args.list_failures
+            else " (use --list-failures to check every benchmark)"
+        )
+        print(f"ERROR: Test vector verification failed for: {', '.join(failed)}{hint}")
         return 1
 
     print("All test vectors verified")
@@ -4,9 +4,11 @@
 """Unit tests for verify_test_vectors.py."""
 from __future__ import annotations
 
+import io
 import json
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
 from unittest.mock import patch
 
@@ -56,6 +58,25 @@ class TestVerifyTestVectors(unittest.TestCase):
         finally:
             Path(path).unlink()
 
+    def test_list_failures_reports_every_failure(self) -> None:
+        """Test that --list-failures names all failed benchmarks."""
+        data = {
+            "benchmarks": {
+                "bench1": {"test_vectors": {"verified": False}},
+                "bench2": {"test_vectors": {"verified": True}},
+                "bench3": {},
+            }
+        }
+        path = self._create_temp_json(data)
+        argv = ["verify_test_vectors.py", "--results", path, "--list-failures"]
+        try:
+            with patch("sys.argv", argv), redirect_stdout(io.StringIO()) as out:
+                result = main()
+            self.assertEqual(result, 1)
+            self.assertIn("bench1, bench3", out.getvalue())
+        finally:
+            Path(path).unlink()
+
     def test_missing_verified_field_fails(self) -> None:
         """Test that missing verified field is treated as failure."""
         data = {